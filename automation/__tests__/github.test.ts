@@ -0,0 +1,27 @@
+import { describe, it, expect } from "bun:test";
+import { formatErrorDetails, MAX_ERROR_DETAIL_CHARS } from "../src/github.ts";
+
+describe("formatErrorDetails", () => {
+  it("should return short error messages unchanged", () => {
+    expect(formatErrorDetails("Validation failed - cannot create PR")).toBe(
+      "Validation failed - cannot create PR"
+    );
+  });
+
+  it("should keep a message at exactly the limit", () => {
+    const message = "e".repeat(MAX_ERROR_DETAIL_CHARS);
+    expect(formatErrorDetails(message)).toBe(message);
+  });
+
+  it("should truncate past the limit and report how much was removed", () => {
+    const message = "e".repeat(MAX_ERROR_DETAIL_CHARS + 1234);
+    const details = formatErrorDetails(message);
+
+    expect(details).toBe(`${"e".repeat(MAX_ERROR_DETAIL_CHARS)}\n... (truncated 1234 chars)`);
+  });
+
+  it("should keep the formatted details under GitHub's comment limit", () => {
+    const details = formatErrorDetails("e".repeat(200_000));
+    expect(details.length).toBeLessThan(65_536);
+  });
+});
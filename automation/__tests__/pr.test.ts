@@ -1,4 +1,5 @@
 import { describe, it, expect } from "bun:test";
+import { outputSnippet, OUTPUT_SNIPPET_CHARS } from "../src/pr.ts";
 
 describe("Git Status Parsing", () => {
   it("should extract filepath from modified status", () => {
@@ -232,3 +233,24 @@ describe("PR Body Generation", () => {
     expect(body).toContain("Failed: 2 tests failed");
   });
 });
+
+describe("Validation Output Snippet", () => {
+  it("should return short output trimmed", () => {
+    expect(outputSnippet("  12 pass\n0 fail\n")).toBe("12 pass\n0 fail");
+  });
+
+  it("should keep output at exactly the limit without an ellipsis", () => {
+    const text = "x".repeat(OUTPUT_SNIPPET_CHARS);
+    expect(outputSnippet(text)).toBe(text);
+  });
+
+  it("should truncate output past the limit and mark it", () => {
+    const text = "x".repeat(OUTPUT_SNIPPET_CHARS + 1);
+    const snippet = outputSnippet(text);
+    expect(snippet).toBe(`${"x".repeat(OUTPUT_SNIPPET_CHARS)}...`);
+  });
+
+  it("should return an empty string for empty output", () => {
+    expect(outputSnippet("")).toBe("");
+  });
+});
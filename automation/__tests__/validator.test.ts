@@ -0,0 +1,100 @@
+import { describe, it, expect } from "bun:test";
+import {
+  collectMatchingLines,
+  readBounded,
+  MAX_OUTPUT_BYTES,
+} from "../src/validator.ts";
+
+describe("collectMatchingLines", () => {
+  const isError = (line: string) => line.includes("error");
+
+  it("should match split-based filtering for output with a trailing newline", () => {
+    const output = "src/a.ts(1,1): error TS1\nok\n  src/b.ts(2,2): error TS2  \n";
+    const expected = output
+      .split("\n")
+      .filter(isError)
+      .map((line) => line.trim());
+
+    expect(collectMatchingLines(output, isError)).toEqual(expected);
+    expect(collectMatchingLines(output, isError)).toEqual([
+      "src/a.ts(1,1): error TS1",
+      "src/b.ts(2,2): error TS2",
+    ]);
+  });
+
+  it("should include the final line when there is no trailing newline", () => {
+    expect(collectMatchingLines("ok\nlast error", isError)).toEqual(["last error"]);
+  });
+
+  it("should return no matches for empty input", () => {
+    expect(collectMatchingLines("", isError)).toEqual([]);
+  });
+
+  it("should still visit the empty final line after a trailing newline", () => {
+    const seen: string[] = [];
+    collectMatchingLines("a\n", (line) => {
+      seen.push(line);
+      return false;
+    });
+    expect(seen).toEqual(["a", ""]);
+  });
+
+  it("should stop scanning once the limit is reached", () => {
+    const output = Array.from({ length: 50 }, (_, i) => `error ${i}`).join("\n");
+    const visited: string[] = [];
+    const matches = collectMatchingLines(
+      output,
+      (line) => {
+        visited.push(line);
+        return true;
+      },
+      3
+    );
+
+    expect(matches).toEqual(["error 0", "error 1", "error 2"]);
+    expect(visited.length).toBe(3);
+  });
+
+  it("should return every match when no limit is given", () => {
+    const output = Array.from({ length: 30 }, (_, i) => `error ${i}`).join("\n");
+    expect(collectMatchingLines(output, isError).length).toBe(30);
+  });
+});
+
+describe("readBounded", () => {
+  /** Stream that yields `count` chunks of `size` bytes and records how many were pulled */
+  function chunkedStream(count: number, size: number) {
+    const state = { pulled: 0 };
+    const stream = new ReadableStream<Uint8Array>({
+      pull(controller) {
+        if (state.pulled === count) {
+          controller.close();
+          return;
+        }
+        state.pulled++;
+        controller.enqueue(new Uint8Array(size).fill(0x61)); // "a"
+      },
+    });
+    return { stream, state };
+  }
+
+  it("should return small output unchanged", async () => {
+    const { stream } = chunkedStream(2, 4);
+    expect(await readBounded(stream)).toBe("aaaaaaaa");
+  });
+
+  it("should return an empty string for an empty stream", async () => {
+    const { stream } = chunkedStream(0, 0);
+    expect(await readBounded(stream)).toBe("");
+  });
+
+  it("should cap retained output and still drain the stream", async () => {
+    const chunkSize = MAX_OUTPUT_BYTES / 2 + 1;
+    const { stream, state } = chunkedStream(4, chunkSize);
+
+    const text = await readBounded(stream);
+
+    expect(text.length).toBe(MAX_OUTPUT_BYTES);
+    expect(state.pulled).toBe(4);
+  });
+});
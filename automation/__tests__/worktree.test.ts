@@ -0,0 +1,62 @@
+import { describe, it, expect } from "bun:test";
+import { parseWorktreeInfo } from "../src/worktree.ts";
+
+/** `git worktree list --porcelain` output with the main tree and two automation worktrees */
+const PORCELAIN_LISTING = [
+  "worktree /repo",
+  "HEAD 1111111111111111111111111111111111111111",
+  "branch refs/heads/develop",
+  "",
+  "worktree /repo/automation/.worktrees/123-2026-02-01T07-59-00Z",
+  "HEAD 2222222222222222222222222222222222222222",
+  "branch refs/heads/automation/123-2026-02-01T07-59-00Z",
+  "",
+  "worktree /repo/automation/.worktrees/456-2026-02-02T08-00-00Z",
+  "HEAD 3333333333333333333333333333333333333333",
+  "detached",
+  "",
+  "worktree /repo/automation/.worktrees/789-2026-02-03T09-00-00Z",
+  "HEAD 4444444444444444444444444444444444444444",
+  "branch refs/heads/automation/789-2026-02-03T09-00-00Z",
+  "",
+].join("\n");
+
+describe("parseWorktreeInfo", () => {
+  it("should return branch and commit for a worktree in the middle of the listing", () => {
+    const info = parseWorktreeInfo(
+      PORCELAIN_LISTING,
+      "/repo/automation/.worktrees/123-2026-02-01T07-59-00Z"
+    );
+    expect(info).toEqual({
+      branch: "refs/heads/automation/123-2026-02-01T07-59-00Z",
+      commit: "2222222222222222222222222222222222222222",
+    });
+  });
+
+  it("should return the last worktree in the listing", () => {
+    const info = parseWorktreeInfo(
+      PORCELAIN_LISTING,
+      "/repo/automation/.worktrees/789-2026-02-03T09-00-00Z"
+    );
+    expect(info).toEqual({
+      branch: "refs/heads/automation/789-2026-02-03T09-00-00Z",
+      commit: "4444444444444444444444444444444444444444",
+    });
+  });
+
+  it("should return null for a detached worktree", () => {
+    const info = parseWorktreeInfo(
+      PORCELAIN_LISTING,
+      "/repo/automation/.worktrees/456-2026-02-02T08-00-00Z"
+    );
+    expect(info).toBeNull();
+  });
+
+  it("should return null for a path that is not listed", () => {
+    expect(parseWorktreeInfo(PORCELAIN_LISTING, "/repo/automation/.worktrees/999-missing")).toBeNull();
+  });
+
+  it("should return null for empty output", () => {
+    expect(parseWorktreeInfo("", "/repo")).toBeNull();
+  });
+});
@@ -7,7 +7,7 @@
  * Issue: #148 - Deep KotaDB Integration
  */
 import { join } from "node:path";
-import { query, type SDKMessage } from "@anthropic-ai/claude-code";
+import { query } from "@anthropic-ai/claude-code";
 import type { WorkflowLogger } from "./logger.ts";
 import type { ConsoleReporter } from "./reporter.ts";
 import { getAllWorkflowContexts } from "./context.ts";
@@ -32,6 +32,43 @@ export interface AutoRecordFailureOptions {
   reporter: ConsoleReporter;
 }
 
+/**
+ * Build SDK options for auto-record queries (haiku + memory toolset only)
+ */
+function buildAutoRecordOptions(projectRoot: string, logger: WorkflowLogger) {
+  return {
+    model: "claude-haiku-4-5-20251001",
+    maxTurns: 5,
+    cwd: projectRoot,
+    permissionMode: "bypassPermissions" as const,
+    mcpServers: {
+      kotadb: {
+        type: "stdio" as const,
+        command: "bunx",
+        args: ["--bun", "kotadb", "--stdio", "--toolset", "memory"],
+        env: { KOTADB_PATH: join(projectRoot, ".kotadb", "kota.db") }
+      }
+    },
+    stderr: (data: string) => {
+      logger.logEvent("AUTO_RECORD_SDK_STDERR", { data });
+    }
+  };
+}
+
+/**
+ * Run an auto-record prompt, forwarding SDK messages to the workflow logger
+ */
+async function runAutoRecordQuery(
+  prompt: string,
+  projectRoot: string,
+  logger: WorkflowLogger
+): Promise<void> {
+  const options = buildAutoRecordOptions(projectRoot, logger);
+  for await (const message of query({ prompt, options })) {
+    logger.addMessage(message);
+  }
+}
+
 /**
  * Auto-record successful workflow as a decision
  */
@@ -62,29 +99,7 @@ Use record_decision tool with:
 - related_files: [${filesModified.map(f => `"${f}"`).join(', ')}]
 `;
 
-  const sdkOptions = {
-    model: "claude-haiku-4-5-20251001",
-    maxTurns: 5,
-    cwd: projectRoot,
-    permissionMode: "bypassPermissions" as const,
-    mcpServers: {
-      kotadb: {
-        type: "stdio" as const,
-        command: "bunx",
-        args: ["--bun", "kotadb", "--stdio", "--toolset", "memory"],
-        env: { KOTADB_PATH: join(projectRoot, ".kotadb", "kota.db") }
-      }
-    },
-    stderr: (data: string) => {
-      logger.logEvent("AUTO_RECORD_SDK_STDERR", { data });
-    }
-  };
-  
-  const messages: SDKMessage[] = [];
-  for await (const message of query({ prompt, options: sdkOptions })) {
-    messages.push(message);
-    logger.addMessage(message);
-  }
+  await runAutoRecordQuery(prompt, projectRoot, logger);
   
   logger.logEvent("AUTO_RECORD_COMPLETE", { workflow_id: workflowId, type: "decision" });
   reporter.logKeyAction("Recorded workflow success as decision");
@@ -119,29 +134,7 @@ Use record_failure tool with:
 - failure_reason: "${error}"
 `;
 
-  const sdkOptions = {
-    model: "claude-haiku-4-5-20251001",
-    maxTurns: 5,
-    cwd: projectRoot,
-    permissionMode: "bypassPermissions" as const,
-    mcpServers: {
-      kotadb: {
-        type: "stdio" as const,
-        command: "bunx",
-        args: ["--bun", "kotadb", "--stdio", "--toolset", "memory"],
-        env: { KOTADB_PATH: join(projectRoot, ".kotadb", "kota.db") }
-      }
-    },
-    stderr: (data: string) => {
-      logger.logEvent("AUTO_RECORD_SDK_STDERR", { data });
-    }
-  };
-  
-  const messages: SDKMessage[] = [];
-  for await (const message of query({ prompt, options: sdkOptions })) {
-    messages.push(message);
-    logger.addMessage(message);
-  }
+  await runAutoRecordQuery(prompt, projectRoot, logger);
   
   logger.logEvent("AUTO_RECORD_COMPLETE", { workflow_id: workflowId, type: "failure" });
   reporter.logKeyAction("Recorded workflow failure for learning");
@@ -3,6 +3,7 @@
  * Uses a semaphore pattern for concurrency control (no external deps)
  */
 import { runWorkflow } from "./workflow.ts";
+import { fetchIssueContent } from "./orchestrator.ts";
 import {
   createWorktree,
   formatWorktreeTimestamp,
@@ -111,6 +112,10 @@ export async function runBatch(
 
         process.stderr.write(`[batch] Starting issue #${issueNumber}\n`);
 
+        // Overlap the issue fetch (network) with worktree creation (local git)
+        const prefetchedIssue = fetchIssueContent(issueNumber);
+        prefetchedIssue.catch(() => {});
+
         // Each issue gets its own worktree
         let worktreeInfo: WorktreeInfo | null = null;
         if (!options.dryRun) {
@@ -137,6 +142,7 @@ export async function runBatch(
           workingDirectory: worktreeInfo?.path ?? projectRoot,
           mainProjectRoot: projectRoot,
           branchName: worktreeInfo?.branch,
+          prefetchedIssue,
         });
 
         const durationMs = Math.round(performance.now() - issueStart);
@@ -3,7 +3,7 @@
  * Stores checkpoint data at automation/.data/checkpoints/{issueNumber}.json
  * Uses atomic writes (write .tmp then rename) for safety
  */
-import { existsSync, mkdirSync, readdirSync, readFileSync, renameSync, unlinkSync, writeFileSync } from "node:fs";
+import { mkdirSync, readdirSync, readFileSync, renameSync, unlinkSync, writeFileSync } from "node:fs";
 import { join } from "node:path";
 
 const CHECKPOINT_DIR = join(
@@ -26,15 +26,6 @@ export interface CheckpointData {
   updatedAt: string;
 }
 
-/**
- * Ensure checkpoint directory exists
- */
-function ensureDir(): void {
-  if (!existsSync(CHECKPOINT_DIR)) {
-    mkdirSync(CHECKPOINT_DIR, { recursive: true });
-  }
-}
-
 /**
  * Get checkpoint file path for an issue
  */
@@ -46,30 +37,32 @@ function checkpointPath(issueNumber: number): string {
  * Write checkpoint data atomically (write .tmp then rename)
  */
 export function writeCheckpoint(data: CheckpointData): void {
-  ensureDir();
+  mkdirSync(CHECKPOINT_DIR, { recursive: true });
   const filePath = checkpointPath(data.issueNumber);
   const tmpPath = `${filePath}.tmp`;
 
-  const payload = JSON.stringify(data, null, 2);
+  // Compact: checkpoints are only read back by --resume
+  const payload = JSON.stringify(data);
   writeFileSync(tmpPath, payload, "utf-8");
   renameSync(tmpPath, filePath);
 }
 
 /**
  * Read the latest checkpoint for an issue, or null if none exists
+ * Reads directly and treats ENOENT as "no checkpoint" (no separate exists probe)
  */
 export function readLatestCheckpoint(
   issueNumber: number
 ): CheckpointData | null {
   const filePath = checkpointPath(issueNumber);
-  if (!existsSync(filePath)) {
-    return null;
-  }
 
   try {
     const text = readFileSync(filePath, "utf-8");
     return JSON.parse(text) as CheckpointData;
-  } catch {
+  } catch (error) {
+    if ((error as NodeJS.ErrnoException).code === "ENOENT") {
+      return null;
+    }
     process.stderr.write(
       `[checkpoint] Warning: Failed to read checkpoint for issue #${issueNumber}\n`
     );
@@ -81,9 +74,13 @@ export function readLatestCheckpoint(
  * Clear (delete) checkpoint for an issue
  */
 export function clearCheckpoint(issueNumber: number): void {
-  const filePath = checkpointPath(issueNumber);
-  if (existsSync(filePath)) {
-    unlinkSync(filePath);
+  try {
+    unlinkSync(checkpointPath(issueNumber));
+  } catch (error) {
+    // Already absent is fine; anything else is a real failure
+    if ((error as NodeJS.ErrnoException).code !== "ENOENT") {
+      throw error;
+    }
   }
 }
 
@@ -91,7 +88,7 @@ export function clearCheckpoint(issueNumber: number): void {
  * List all active checkpoints
  */
 export function listCheckpoints(): CheckpointData[] {
-  ensureDir();
+  mkdirSync(CHECKPOINT_DIR, { recursive: true });
   const checkpoints: CheckpointData[] = [];
 
   const files = readdirSync(CHECKPOINT_DIR).filter((f) =>
@@ -14,10 +14,35 @@ export interface CommentOptions {
   sessionId: string | null;
 }
 
-async function getRepoPath(): Promise<string> {
+/** Cap on error details in the comment; GitHub rejects bodies over 65,536 chars */
+export const MAX_ERROR_DETAIL_CHARS = 60_000;
+
+/** Shared handle: prefetchRepoPath starts the lookup, postIssueComment awaits it */
+let repoPathPromise: Promise<string> | null = null;
+
+function getRepoPath(): Promise<string> {
+  if (!repoPathPromise) {
+    repoPathPromise = resolveRepoPath().catch((error) => {
+      // Don't cache failures; the next caller retries
+      repoPathPromise = null;
+      throw error;
+    });
+  }
+  return repoPathPromise;
+}
+
+/**
+ * Start resolving the repo path in the background so the final comment does
+ * not wait on git. Failures are left for postIssueComment to retry and report.
+ */
+export function prefetchRepoPath(): void {
+  getRepoPath().catch(() => {});
+}
+
+async function resolveRepoPath(): Promise<string> {
   const proc = Bun.spawn(["git", "remote", "get-url", "origin"], {
     stdout: "pipe",
-    stderr: "pipe",
+    stderr: "ignore", // Failure is reported via exit code alone
   });
 
   const output = await new Response(proc.stdout).text();
@@ -52,6 +77,14 @@ function formatCost(usd: number): string {
   return `$${usd.toFixed(4)}`;
 }
 
+export function formatErrorDetails(message: string): string {
+  if (message.length <= MAX_ERROR_DETAIL_CHARS) {
+    return message;
+  }
+  const removed = message.length - MAX_ERROR_DETAIL_CHARS;
+  return `${message.slice(0, MAX_ERROR_DETAIL_CHARS)}\n... (truncated ${removed} chars)`;
+}
+
 export async function postIssueComment(options: CommentOptions): Promise<void> {
   const repo = await getRepoPath();
   const statusEmoji = options.success ? "✅" : "❌";
@@ -77,7 +110,7 @@ export async function postIssueComment(options: CommentOptions): Promise<void> {
   }
 
   if (options.errorMessage) {
-    body += `\n### Error Details\n\n\`\`\`\n${options.errorMessage}\n\`\`\`\n`;
+    body += `\n### Error Details\n\n\`\`\`\n${formatErrorDetails(options.errorMessage)}\n\`\`\`\n`;
   }
 
   body += `\n---\n*Generated by KotaDB Automation*`;
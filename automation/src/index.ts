@@ -32,30 +32,30 @@ if (!process.env.ANTHROPIC_API_KEY) {
   process.exit(1);
 }
 
-import { runWorkflow } from "./workflow.ts";
+// workflow.ts, orchestrator.ts and batch.ts pull in the agent SDK; they are
+// imported on demand so --help, --metrics and --status start without it
 import {
   recordMetrics,
+  recordMetricsBatch,
   getRecentMetrics,
   closeMetricsDb,
   type WorkflowMetrics,
 } from "./metrics.ts";
-import { postIssueComment } from "./github.ts";
+import { postIssueComment, prefetchRepoPath } from "./github.ts";
 import { 
   createWorktree, 
   formatWorktreeTimestamp,
   type WorktreeInfo 
 } from "./worktree.ts";
 import { readLatestCheckpoint } from "./checkpoint.ts";
-import {
-  runBatch,
-  discoverIssuesByLabel,
-  formatBatchSummary,
-  type BatchOptions,
-} from "./batch.ts";
+import type { BatchOptions } from "./batch.ts";
+
+/** Issue reference in #123 or 123 format */
+const ISSUE_NUMBER_PATTERN = /^#?(\d+)$/;
 
 function parseIssueNumber(arg: string): number | null {
   // Support #123 or 123 format
-  const match = arg.match(/^#?(\d+)$/);
+  const match = arg.match(ISSUE_NUMBER_PATTERN);
   return match?.[1] ? parseInt(match[1], 10) : null;
 }
 
@@ -188,6 +188,7 @@ async function handleBatch(args: string[]): Promise<number> {
   const accumulateContext = args.includes("--accumulate-context");
   const skipComment = args.includes("--no-comment");
   const concurrency = getFlagNumericValue(args, "--concurrency") ?? 3;
+  const { runBatch, discoverIssuesByLabel, formatBatchSummary } = await import("./batch.ts");
 
   let issues: number[] = [];
 
@@ -227,22 +228,19 @@ async function handleBatch(args: string[]): Promise<number> {
   process.stdout.write(formatBatchSummary(result));
 
   // Record individual metrics
-  for (const r of result.results) {
-    const metrics: WorkflowMetrics = {
-      issue_number: r.issueNumber,
-      started_at: new Date().toISOString(),
-      completed_at: new Date().toISOString(),
-      success: r.success,
-      duration_ms: r.durationMs,
-      input_tokens: 0,
-      output_tokens: 0,
-      total_cost_usd: r.costUsd,
-      pr_url: r.prUrl ?? null,
-      error_message: r.error ?? null,
-      session_id: null,
-    };
-    recordMetrics(metrics);
-  }
+  recordMetricsBatch(result.results.map((r): WorkflowMetrics => ({
+    issue_number: r.issueNumber,
+    started_at: new Date().toISOString(),
+    completed_at: new Date().toISOString(),
+    success: r.success,
+    duration_ms: r.durationMs,
+    input_tokens: 0,
+    output_tokens: 0,
+    total_cost_usd: r.costUsd,
+    pr_url: r.prUrl ?? null,
+    error_message: r.error ?? null,
+    session_id: null,
+  })));
 
   closeMetricsDb();
   return result.failureCount > 0 ? 1 : 0;
@@ -301,6 +299,10 @@ async function handleResume(args: string[]): Promise<number> {
   const accumulateContext = args.includes("--accumulate-context");
   const skipComment = args.includes("--no-comment");
 
+  if (!skipComment && !dryRun) {
+    prefetchRepoPath();
+  }
+
   // Use worktree from checkpoint if available, otherwise create new
   let worktreeInfo: WorktreeInfo | null = null;
   if (checkpoint?.worktreePath && existsSync(checkpoint.worktreePath)) {
@@ -327,6 +329,7 @@ async function handleResume(args: string[]): Promise<number> {
     `Starting workflow for issue #${issueNumber}${resumeFromPhase ? ` (resuming from ${resumeFromPhase})` : ""}${dryRun ? " (dry run)" : ""}\n`
   );
 
+  const { runWorkflow } = await import("./workflow.ts");
   const startedAt = new Date().toISOString();
   const startTime = performance.now();
 
@@ -476,6 +479,19 @@ async function main(): Promise<number> {
   const verbose = args.includes("--verbose") || args.includes("-v");
   const accumulateContext = args.includes("--accumulate-context");
 
+  const [{ runWorkflow }, { fetchIssueContent }] = await Promise.all([
+    import("./workflow.ts"),
+    import("./orchestrator.ts"),
+  ]);
+
+  // Start the issue fetch (network) while the worktree is created (local git);
+  // the orchestrator awaits it and surfaces any fetch error as before
+  const prefetchedIssue = fetchIssueContent(issueNumber);
+  prefetchedIssue.catch(() => {});
+  if (!skipComment && !dryRun) {
+    prefetchRepoPath();
+  }
+
   // Create worktree info (but don't create actual worktree in dry-run)
   const timestamp = formatWorktreeTimestamp(new Date());
   let worktreeInfo: WorktreeInfo | null = null;
@@ -517,7 +533,8 @@ async function main(): Promise<number> {
       accumulateContext,
       workingDirectory: worktreeInfo?.path ?? projectRoot,
       mainProjectRoot: projectRoot,  // Always use main repo for logs
-      branchName: worktreeInfo?.branch
+      branchName: worktreeInfo?.branch,
+      prefetchedIssue
     });
     const endTime = performance.now();
     const durationMs = Math.round(endTime - startTime);
@@ -11,7 +11,7 @@
  * - agent-output.json: Complete SDK message stream with summary
  * - errors.log: Error messages with stack traces
  */
-import { mkdirSync, writeFileSync, existsSync, readFileSync, unlinkSync, appendFileSync } from "node:fs";
+import { mkdirSync, writeFileSync, unlinkSync, appendFileSync } from "node:fs";
 import { join } from "node:path";
 import type { SDKMessage, SDKSystemMessage, SDKResultMessage } from "@anthropic-ai/claude-code";
 
@@ -86,9 +86,7 @@ export class WorkflowLogger {
    */
   initialize(): void {
     try {
-      if (!existsSync(this.logDir)) {
-        mkdirSync(this.logDir, { recursive: true });
-      }
+      mkdirSync(this.logDir, { recursive: true });
       
       // Test write permissions
       const testFile = join(this.logDir, ".writetest");
@@ -212,7 +210,9 @@ export class WorkflowLogger {
       }
     };
     
-    const sanitized = this.sanitize(JSON.stringify(output, null, 2));
+    // Compact encoding: the message stream dominates log size and indenting
+    // it roughly doubles serialization cost (pipe through jq to inspect)
+    const sanitized = this.sanitize(JSON.stringify(output));
     const outputPath = join(this.logDir, "agent-output.json");
     
     try {
@@ -235,10 +235,7 @@ export class WorkflowLogger {
     
     try {
       const sanitized = this.sanitize(entry);
-      const current = existsSync(this.errorsLogPath) 
-        ? readFileSync(this.errorsLogPath, "utf-8") 
-        : "";
-      writeFileSync(this.errorsLogPath, current + sanitized, { encoding: "utf-8", mode: 0o600 });
+      appendFileSync(this.errorsLogPath, sanitized, { encoding: "utf-8", mode: 0o600 });
     } catch (writeError) {
       // Fallback to stderr if file write fails
       process.stderr.write(`Failed to write error log: ${writeError}\n`);
@@ -284,10 +281,7 @@ export class WorkflowLogger {
   private appendToWorkflowLog(content: string): void {
     try {
       const sanitized = this.sanitize(content);
-      const current = existsSync(this.workflowLogPath)
-        ? readFileSync(this.workflowLogPath, "utf-8")
-        : "";
-      writeFileSync(this.workflowLogPath, current + sanitized, { encoding: "utf-8", mode: 0o600 });
+      appendFileSync(this.workflowLogPath, sanitized, { encoding: "utf-8", mode: 0o600 });
     } catch (error) {
       // Log to stderr but don't throw - logging failures should not abort workflow
       process.stderr.write(`Warning: Failed to write workflow log: ${error}\n`);
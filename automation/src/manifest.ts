@@ -4,9 +4,8 @@
  * Manages a JSON manifest of workflow runs at automation/.data/manifest.json.
  * Supports concurrent access via atomic writes (write .tmp, rename).
  */
-import { existsSync, readFileSync, writeFileSync, renameSync, unlinkSync } from "node:fs";
+import { existsSync, mkdirSync, readFileSync, writeFileSync, renameSync, unlinkSync } from "node:fs";
 import { join, dirname } from "node:path";
-import { mkdirSync } from "node:fs";
 
 export interface ManifestEntry {
   issueNumber: number;
@@ -31,9 +30,6 @@ function getManifestPath(projectRoot: string): string {
  */
 export function readManifest(projectRoot: string): ManifestEntry[] {
   const manifestPath = getManifestPath(projectRoot);
-  if (!existsSync(manifestPath)) {
-    return [];
-  }
 
   try {
     const raw = readFileSync(manifestPath, "utf-8");
@@ -42,7 +38,10 @@ export function readManifest(projectRoot: string): ManifestEntry[] {
       return [];
     }
     return parsed as ManifestEntry[];
-  } catch {
+  } catch (error) {
+    if ((error as NodeJS.ErrnoException).code === "ENOENT") {
+      return [];
+    }
     process.stderr.write(`Warning: Failed to read manifest, returning empty\n`);
     return [];
   }
@@ -59,9 +58,7 @@ export function updateManifest(
   const manifestPath = getManifestPath(projectRoot);
   const dir = dirname(manifestPath);
 
-  if (!existsSync(dir)) {
-    mkdirSync(dir, { recursive: true });
-  }
+  mkdirSync(dir, { recursive: true });
 
   const entries = readManifest(projectRoot);
 
@@ -3,7 +3,7 @@
  */
 import { Database } from "bun:sqlite";
 import { join, dirname } from "node:path";
-import { mkdirSync, existsSync } from "node:fs";
+import { mkdirSync } from "node:fs";
 
 export interface WorkflowMetrics {
   id?: number;
@@ -24,9 +24,7 @@ let db: Database | null = null;
 
 function getDbPath(): string {
   const dataDir = join(dirname(import.meta.dir), ".data");
-  if (!existsSync(dataDir)) {
-    mkdirSync(dataDir, { recursive: true });
-  }
+  mkdirSync(dataDir, { recursive: true });
   return join(dataDir, "metrics.db");
 }
 
@@ -70,7 +68,8 @@ function initializeSchema(database: Database): void {
 
 export function recordMetrics(metrics: WorkflowMetrics): number {
   const database = getDb();
-  const stmt = database.prepare(`
+  // query() caches the compiled statement on the connection across calls
+  const stmt = database.query(`
     INSERT INTO workflow_metrics (
       issue_number, started_at, completed_at, success, duration_ms,
       input_tokens, output_tokens, total_cost_usd, pr_url, error_message, session_id
@@ -94,6 +93,18 @@ export function recordMetrics(metrics: WorkflowMetrics): number {
   return Number(result.lastInsertRowid);
 }
 
+/**
+ * Record several runs in one transaction (a single commit instead of one per row)
+ */
+export function recordMetricsBatch(entries: WorkflowMetrics[]): void {
+  const database = getDb();
+  database.transaction((rows: WorkflowMetrics[]) => {
+    for (const row of rows) {
+      recordMetrics(row);
+    }
+  })(entries);
+}
+
 export interface RecentMetricsResult {
   id: number;
   issue_number: number;
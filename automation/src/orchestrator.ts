@@ -5,7 +5,6 @@
 import { join } from "node:path";
 import { 
   query, 
-  type SDKMessage, 
   type HookInput, 
   type HookCallback,
   type HookCallbackMatcher,
@@ -22,7 +21,7 @@ import {
   parseAnalysis, 
   extractSpecPath, 
   extractFilePaths, 
-  extractTextFromMessages 
+  extractMessageText 
 } from "./parser.ts";
 import { handlePRCreation, commitExpertiseChanges, type IssueType } from "./pr.ts";
 import { clearWorkflowContext, getWorkflowContext } from "./context.ts";
@@ -36,7 +35,7 @@ import { validateBuildOutput, formatValidationErrors, type ValidationResult } fr
 /**
  * GitHub issue data fetched via gh CLI
  */
-interface GitHubIssue {
+export interface GitHubIssue {
   title: string;
   body: string;
   labels: Array<{ name: string }>;
@@ -68,6 +67,8 @@ export interface OrchestrationOptions {
     filesModified: string[];
     completedPhases: string[];
   };
+  /** Issue fetch already in flight (started by the caller to overlap setup work) */
+  prefetchedIssue?: Promise<GitHubIssue>;
 }
 
 /**
@@ -125,7 +126,8 @@ function createPreToolUseHook(
 ): HookCallback {
   return async (input: HookInput) => {
     try {
-      if (input.hook_event_name === "PreToolUse") {
+      // Summaries are only displayed in verbose mode; skip building them otherwise
+      if (input.hook_event_name === "PreToolUse" && reporter.isVerbose()) {
         const summary = summarizeToolInput(input.tool_name, input.tool_input);
         reporter.logToolUse(input.tool_name, summary);
       }
@@ -145,10 +147,14 @@ function createPostToolUseHook(
   return async (input: HookInput) => {
     try {
       if (input.hook_event_name === "PostToolUse") {
+        const keyAction = isKeyAction(input.tool_name);
+        if (!keyAction && !reporter.isVerbose()) {
+          return {};
+        }
         const summary = summarizeToolOutput(input.tool_name, input.tool_input);
         
         // Always log key actions (file creation, modification)
-        if (isKeyAction(input.tool_name) && summary) {
+        if (keyAction && summary) {
           reporter.logKeyAction(summary);
         } else if (reporter.isVerbose()) {
           reporter.logToolComplete(input.tool_name, summary);
@@ -202,7 +208,8 @@ export async function orchestrateWorkflow(
     verbose, 
     workflowId,
     resumeFromPhase,
-    checkpointData
+    checkpointData,
+    prefetchedIssue
   } = opts;
 
   // Determine which phases to skip based on resume support
@@ -232,9 +239,16 @@ export async function orchestrateWorkflow(
 
   const startedAt = new Date().toISOString();
 
-  // Fetch issue title early for PR creation
-  const issueData = await fetchIssueContent(issueNumber);
+  // Fetch issue once per workflow; analysis and PR creation both reuse it
+  logger.logEvent("FETCH_ISSUE", { issue_number: issueNumber });
+  const issueData = await (prefetchedIssue ?? fetchIssueContent(issueNumber));
   const issueTitle = issueData.title;
+  logger.logEvent("ISSUE_FETCHED", { 
+    issue_number: issueNumber,
+    title: issueData.title,
+    labels: issueData.labels.map(l => l.name),
+    state: issueData.state
+  });
 
   // Build hooks configuration
   const hooks: Partial<Record<string, HookCallbackMatcher[]>> = {
@@ -293,7 +307,7 @@ export async function orchestrateWorkflow(
     reporter.startPhase("analysis");
     logger.logEvent("PHASE_START", { phase: "analysis" });
     const retryResult = await withRetry(
-      () => analyzeIssue(issueNumber, sdkOptions, logger)
+      () => analyzeIssue(issueNumber, issueData, sdkOptions, logger)
     );
     logRetryStats(logger, "analysis", retryResult);
     const analysisResult = retryResult.result;
@@ -417,6 +431,7 @@ export async function orchestrateWorkflow(
 
   // Phase 3: Build
   let filesModified: string[];
+  let postBuildCuration: Promise<void> = Promise.resolve();
 
   if (shouldSkipPhase("build", completedPhases)) {
     filesModified = resumedFilesModified;
@@ -463,102 +478,113 @@ export async function orchestrateWorkflow(
     });
 
     // CURATION: Post-Build
+    // Runs concurrently with validation (independent I/O); awaited before any
+    // build-fix retry and when the validate phase ends
     if (workflowId) {
-      try {
-        const buildOutput = `Files modified: ${filesModified.join(', ')}\nDomain: ${domain}`;
-        const curatedContext = await curateContext({
-          workflowId,
-          phase: 'post-build',
-          domain,
-          currentPhaseOutput: buildOutput,
-          projectRoot: mainProjectRoot,
-          logger,
-          reporter
-        });
+      const buildOutput = `Files modified: ${filesModified.join(', ')}\nDomain: ${domain}`;
+      postBuildCuration = curateContext({
+        workflowId,
+        phase: 'post-build',
+        domain,
+        currentPhaseOutput: buildOutput,
+        projectRoot: mainProjectRoot,
+        logger,
+        reporter
+      }).then((curatedContext) => {
         logger.logEvent("CONTEXT_CURATED", { 
           workflow_id: workflowId, 
           phase: 'post-build',
           token_count: curatedContext.tokenCount
         });
-      } catch (error) {
+      }).catch((error) => {
         logger.logError("curation_post_build", error instanceof Error ? error : new Error(String(error)));
         reporter.logWarning("Context curation failed (non-fatal)");
-      }
+      });
     }
   }
 
-  // Phase 3.5: Validate build output (build-fix loop)
-  if (!shouldSkipPhase("validate", completedPhases) && !dryRun && filesModified.length > 0) {
-    reporter.startPhase("validate" as any); // validate is new phase
-    logger.logEvent("PHASE_START", { phase: "validate" });
+  // Post-build curation must settle before the workflow leaves this phase,
+  // including when a build-fix retry gives up and throws
+  try {
+    // Phase 3.5: Validate build output (build-fix loop)
+    if (!shouldSkipPhase("validate", completedPhases) && !dryRun && filesModified.length > 0) {
+      reporter.startPhase("validate" as any); // validate is new phase
+      logger.logEvent("PHASE_START", { phase: "validate" });
     
-    let buildAttempt = 0;
-    let validationResult: ValidationResult | null = null;
+      let buildAttempt = 0;
+      let validationResult: ValidationResult | null = null;
     
-    while (buildAttempt <= MAX_BUILD_FIX_RETRIES) {
-      validationResult = await validateBuildOutput({
-        projectRoot,
-        filesModified
-      });
+      while (buildAttempt <= MAX_BUILD_FIX_RETRIES) {
+        validationResult = await validateBuildOutput({
+          projectRoot,
+          filesModified
+        });
       
-      if (validationResult.passed) {
-        logger.logEvent("VALIDATION_PASSED", { attempt: buildAttempt });
-        break;
-      }
+        if (validationResult.passed) {
+          logger.logEvent("VALIDATION_PASSED", { attempt: buildAttempt });
+          break;
+        }
       
-      buildAttempt++;
+        buildAttempt++;
       
-      if (buildAttempt > MAX_BUILD_FIX_RETRIES) {
-        logger.logEvent("VALIDATION_FAILED_FINAL", { 
-          attempt: buildAttempt,
-          summary: validationResult.summary
-        });
-        reporter.logWarning(`Validation failed after ${MAX_BUILD_FIX_RETRIES} fix attempts: ${validationResult.summary}`);
-        break;
-      }
+        if (buildAttempt > MAX_BUILD_FIX_RETRIES) {
+          logger.logEvent("VALIDATION_FAILED_FINAL", { 
+            attempt: buildAttempt,
+            summary: validationResult.summary
+          });
+          reporter.logWarning(`Validation failed after ${MAX_BUILD_FIX_RETRIES} fix attempts: ${validationResult.summary}`);
+          break;
+        }
       
-      // Build-fix loop: re-invoke build with error context
-      logger.logEvent("BUILD_FIX_RETRY", { attempt: buildAttempt, errors: validationResult.summary });
-      reporter.logWarning(`Validation failed (attempt ${buildAttempt}/${MAX_BUILD_FIX_RETRIES}), retrying build with error context...`);
+        // Build-fix loop: re-invoke build with error context
+        logger.logEvent("BUILD_FIX_RETRY", { attempt: buildAttempt, errors: validationResult.summary });
+        reporter.logWarning(`Validation failed (attempt ${buildAttempt}/${MAX_BUILD_FIX_RETRIES}), retrying build with error context...`);
       
-      const errorContext = formatValidationErrors(validationResult);
+        const errorContext = formatValidationErrors(validationResult);
+
+        // Keep the curator session out of the build-fix agent's message stream
+        await postBuildCuration;
       
-      // Retrieve curated context again for the retry
-      let retryCuratedContext: string | null = null;
-      if (workflowId) {
-        try {
-          const ctx = getWorkflowContext(workflowId, 'plan');
-          if (ctx?.summary) {
-            retryCuratedContext = ctx.summary.slice(0, 2000);
-          }
-        } catch { /* non-fatal */ }
-      }
+        // Retrieve curated context again for the retry
+        let retryCuratedContext: string | null = null;
+        if (workflowId) {
+          try {
+            const ctx = getWorkflowContext(workflowId, 'plan');
+            if (ctx?.summary) {
+              retryCuratedContext = ctx.summary.slice(0, 2000);
+            }
+          } catch { /* non-fatal */ }
+        }
       
-      const retryResult = await withRetry(
-        () => executeBuild(domain, specPath, sdkOptions, logger, dryRun, retryCuratedContext, mainProjectRoot, errorContext)
-      );
-      logRetryStats(logger, "build-fix", retryResult);
-      filesModified = retryResult.result;
-    }
+        const retryResult = await withRetry(
+          () => executeBuild(domain, specPath, sdkOptions, logger, dryRun, retryCuratedContext, mainProjectRoot, errorContext)
+        );
+        logRetryStats(logger, "build-fix", retryResult);
+        filesModified = retryResult.result;
+      }
     
-    logger.logEvent("PHASE_COMPLETE", { phase: "validate", passed: validationResult?.passed ?? false });
-    reporter.completePhase("validate" as any, { passed: validationResult?.passed ?? false });
+      logger.logEvent("PHASE_COMPLETE", { phase: "validate", passed: validationResult?.passed ?? false });
+      reporter.completePhase("validate" as any, { passed: validationResult?.passed ?? false });
     
-    // Write checkpoint after validation
-    writeCheckpoint({
-      issueNumber,
-      workflowId,
-      completedPhases: ["analysis", "plan", "build", "validate"],
-      domain,
-      specPath,
-      filesModified,
-      worktreePath: projectRoot,
-      branchName,
-      createdAt: startedAt,
-      updatedAt: new Date().toISOString()
-    });
-  } else if (shouldSkipPhase("validate", completedPhases)) {
-    logger.logEvent("PHASE_SKIP", { phase: "validate", reason: "resumed" });
+      // Write checkpoint after validation
+      writeCheckpoint({
+        issueNumber,
+        workflowId,
+        completedPhases: ["analysis", "plan", "build", "validate"],
+        domain,
+        specPath,
+        filesModified,
+        worktreePath: projectRoot,
+        branchName,
+        createdAt: startedAt,
+        updatedAt: new Date().toISOString()
+      });
+    } else if (shouldSkipPhase("validate", completedPhases)) {
+      logger.logEvent("PHASE_SKIP", { phase: "validate", reason: "resumed" });
+    }
+  } finally {
+    // Improve consumes the build-phase context, so curation must finish first
+    await postBuildCuration;
   }
 
   // Phase 4: Improve (optional)
@@ -736,7 +762,7 @@ export async function orchestrateWorkflow(
 /**
  * Fetch GitHub issue content via gh CLI
  */
-async function fetchIssueContent(issueNumber: number): Promise<GitHubIssue> {
+export async function fetchIssueContent(issueNumber: number): Promise<GitHubIssue> {
   const proc = Bun.spawn(
     ["gh", "issue", "view", String(issueNumber), "--json", "title,body,labels,state"],
     {
@@ -763,23 +789,28 @@ async function fetchIssueContent(issueNumber: number): Promise<GitHubIssue> {
   };
 }
 
+/**
+ * Stream an agent query into the workflow logger and return its joined text blocks
+ */
+async function collectAgentText(
+  prompt: string,
+  options: AutomationSDKOptions,
+  logger: WorkflowLogger
+): Promise<string> {
+  const textBlocks: string[] = [];
+  for await (const message of query({ prompt, options })) {
+    logger.addMessage(message);
+    textBlocks.push(...extractMessageText(message));
+  }
+  return textBlocks.join("\n\n");
+}
+
 async function analyzeIssue(
   issueNumber: number,
+  issueData: GitHubIssue,
   options: AutomationSDKOptions,
   logger: WorkflowLogger
 ): Promise<string> {
-  // Fetch actual issue content from GitHub
-  logger.logEvent("FETCH_ISSUE", { issue_number: issueNumber });
-  
-  const issueData = await fetchIssueContent(issueNumber);
-  
-  logger.logEvent("ISSUE_FETCHED", { 
-    issue_number: issueNumber,
-    title: issueData.title,
-    labels: issueData.labels.map(l => l.name),
-    state: issueData.state
-  });
-  
   const prompt = `
 You are analyzing GitHub issue #${issueNumber} for automation orchestration.
 
@@ -816,13 +847,7 @@ FORMAT:
 Use github-question-agent expertise to analyze the issue.
 `;
 
-  const messages: SDKMessage[] = [];
-  for await (const message of query({ prompt, options })) {
-    messages.push(message);
-    logger.addMessage(message);
-  }
-
-  return extractTextFromMessages(messages);
+  return collectAgentText(prompt, options, logger);
 }
 
 async function executePlan(
@@ -847,13 +872,7 @@ async function executePlan(
     CURATED_CONTEXT: curatedContext ?? undefined
   });
 
-  const messages: SDKMessage[] = [];
-  for await (const message of query({ prompt, options })) {
-    messages.push(message);
-    logger.addMessage(message);
-  }
-
-  const output = extractTextFromMessages(messages);
+  const output = await collectAgentText(prompt, options, logger);
   return extractSpecPath(output);
 }
 
@@ -889,13 +908,7 @@ async function executeBuild(
   
   const prompt = buildPhasePrompt(agentBody, variables);
 
-  const messages: SDKMessage[] = [];
-  for await (const message of query({ prompt, options })) {
-    messages.push(message);
-    logger.addMessage(message);
-  }
-
-  const output = extractTextFromMessages(messages);
+  const output = await collectAgentText(prompt, options, logger);
   return extractFilePaths(output);
 }
 
@@ -913,9 +926,7 @@ async function executeImprove(
     CURATED_CONTEXT: curatedContext ?? undefined
   });
 
-  const messages: SDKMessage[] = [];
   for await (const message of query({ prompt, options })) {
-    messages.push(message);
     logger.addMessage(message);
   }
 }
@@ -3,6 +3,16 @@
  */
 import type { SDKMessage, SDKAssistantMessage } from "@anthropic-ai/claude-code";
 
+const DOMAIN_PATTERN = /\*\*Domain\*\*:\s*(\S+)/;
+const TYPE_PATTERN = /\*\*Type\*\*:\s*(\S+)/;
+const REQUIREMENTS_PATTERN = /\*\*Requirements\*\*:\s*([\s\S]*?)(?=\*\*|$)/;
+
+/** Absolute path to a markdown file in docs/specs/ */
+const SPEC_PATH_PATTERN = /\/[^\s]+\/docs\/specs\/[^\s]+\.md/;
+
+/** Absolute paths to source/doc/config files (global: String.match returns all) */
+const FILE_PATH_PATTERN = /\/[^\s]+\.(ts|js|md|yaml|json)/g;
+
 /**
  * Parse github-question-agent analysis output
  */
@@ -11,11 +21,11 @@ export function parseAnalysis(output: string): {
   requirements: string;
   issueType: string;
 } {
-  const domainMatch = output.match(/\*\*Domain\*\*:\s*(\S+)/);
-  const typeMatch = output.match(/\*\*Type\*\*:\s*(\S+)/);
+  const domainMatch = output.match(DOMAIN_PATTERN);
+  const typeMatch = output.match(TYPE_PATTERN);
   
   // Extract requirements section
-  const reqMatch = output.match(/\*\*Requirements\*\*:\s*([\s\S]*?)(?=\*\*|$)/);
+  const reqMatch = output.match(REQUIREMENTS_PATTERN);
   
   return {
     domain: domainMatch?.[1] || "github",
@@ -28,9 +38,10 @@ export function parseAnalysis(output: string): {
  * Extract spec path from plan-agent output
  */
 export function extractSpecPath(output: string): string {
-  // Match absolute paths to markdown files in docs/specs/
-  const pathPattern = /\/[^\s]+\/docs\/specs\/[^\s]+\.md/;
-  const match = output.match(pathPattern);
+  // Literal pre-check: skip the regex scan when no spec path can be present
+  const match = output.includes("/docs/specs/")
+    ? output.match(SPEC_PATH_PATTERN)
+    : null;
   
   if (!match) {
     throw new Error("Spec path not found in plan-agent output");
@@ -43,32 +54,29 @@ export function extractSpecPath(output: string): string {
  * Extract modified file paths from build-agent output
  */
 export function extractFilePaths(output: string): string[] {
-  // Match absolute paths
-  const pathPattern = /\/[^\s]+\.(ts|js|md|yaml|json)/g;
-  const matches = output.match(pathPattern);
+  const matches = output.match(FILE_PATH_PATTERN);
   
   return matches ? Array.from(new Set(matches)) : [];
 }
 
 /**
- * Extract text content from SDK messages
+ * Extract text blocks from a single SDK message (empty for non-assistant messages)
  */
-export function extractTextFromMessages(messages: SDKMessage[]): string {
+export function extractMessageText(message: SDKMessage): string[] {
+  if (message.type !== "assistant") {
+    return [];
+  }
+
+  const assistantMsg = message as SDKAssistantMessage;
+  const content = assistantMsg.message.content;
   const textBlocks: string[] = [];
-  
-  for (const message of messages) {
-    if (message.type === "assistant") {
-      const assistantMsg = message as SDKAssistantMessage;
-      const content = assistantMsg.message.content;
-      if (Array.isArray(content)) {
-        for (const block of content) {
-          if (block.type === "text") {
-            textBlocks.push(block.text);
-          }
-        }
+  if (Array.isArray(content)) {
+    for (const block of content) {
+      if (block.type === "text") {
+        textBlocks.push(block.text);
       }
     }
   }
-  
-  return textBlocks.join("\n\n");
+
+  return textBlocks;
 }
@@ -2,6 +2,7 @@
  * PR creation module for automated workflow completion
  * Commits changes, pushes branch, and creates PR via gh CLI
  */
+import { runCommand, TEST_TIMEOUT_MS, TYPE_CHECK_TIMEOUT_MS } from "./validator.ts";
 
 export type IssueType = "feat" | "fix" | "chore" | "refactor";
 
@@ -30,6 +31,15 @@ export interface PRCreationResult {
   errorMessage: string | null;
 }
 
+/** Porcelain status line: two status columns, whitespace, then the path */
+const PORCELAIN_LINE_PATTERN = /^..\s+(.+)$/;
+
+/** Conventional-commit prefix an issue title may already carry */
+const REDUNDANT_PREFIX_PATTERN = /^(feat|fix|chore|refactor|docs|test)\([^)]+\):\s*/i;
+
+/** Max characters of command output carried into the PR body */
+export const OUTPUT_SNIPPET_CHARS = 500;
+
 interface ValidationResult {
   level: 1 | 2 | 3;
   justification: string;
@@ -62,6 +72,14 @@ async function execCommand(
   return { stdout: stdout.trim(), stderr: stderr.trim(), exitCode };
 }
 
+/**
+ * Bounded head of command output for PR evidence lines
+ */
+export function outputSnippet(text: string): string {
+  const head = text.slice(0, OUTPUT_SNIPPET_CHARS).trim();
+  return text.length > OUTPUT_SNIPPET_CHARS ? `${head}...` : head;
+}
+
 /**
  * Format duration in human-readable form
  */
@@ -87,9 +105,16 @@ export async function commitExpertiseChanges(
   issueNumber: number
 ): Promise<string | null> {
   try {
-    // Check for uncommitted changes
+    // Check for uncommitted expertise/spec changes
+    // --no-optional-locks skips the index refresh write so concurrent
+    // workflows probing the same repo don't contend on index.lock; the
+    // pathspecs keep git from classifying the rest of the worktree
     const { stdout: status, exitCode: statusExitCode } = await execCommand(
-      ["git", "status", "--porcelain"],
+      [
+        "git", "--no-optional-locks", "status", "--porcelain", "--",
+        ":(glob)**/expertise.yaml",
+        ":(glob)**/docs/specs/**"
+      ],
       worktreePath
     );
 
@@ -98,14 +123,13 @@ export async function commitExpertiseChanges(
       return null;
     }
 
-    // Filter for expertise.yaml files and spec files
+    // Pathspecs already restrict output to expertise.yaml and spec files
     const lines = status.split("\n").filter((line) => line.trim());
     const expertiseFiles = lines
-      .filter((line) => line.includes("expertise.yaml") || line.includes("docs/specs/"))
       .map((line) => {
         // Git status porcelain format: "XY filename" where X/Y are status codes
         // Extract filename after status prefix (handles " M ", "?? ", "A  ", etc.)
-        const match = line.match(/^..\s+(.+)$/);
+        const match = line.match(PORCELAIN_LINE_PATTERN);
         return match?.[1]?.trim() ?? line.trim();
       });
 
@@ -169,8 +193,7 @@ function formatPRTitle(
   
   // Remove redundant prefixes (e.g., "feat(api): " from issue title)
   let cleanTitle = issueTitle.trim();
-  const redundantPrefixPattern = /^(feat|fix|chore|refactor|docs|test)\([^)]+\):\s*/i;
-  cleanTitle = cleanTitle.replace(redundantPrefixPattern, '');
+  cleanTitle = cleanTitle.replace(REDUNDANT_PREFIX_PATTERN, '');
   
   // Extract imperative verb description
   // "/git:pull_request" format: "<issue_type>: <imperative verb> <feature name> (#<issue_number>)"
@@ -294,29 +317,40 @@ export async function pushBranch(
 
 /**
  * Run validation commands in worktree and capture results
+ * Fails fast: once a command fails, the remaining commands are recorded as
+ * skipped instead of spawned, since PR creation requires every command to pass
  */
 async function runValidation(
   worktreePath: string,
   domain: string
 ): Promise<ValidationResult> {
   const commands = [
-    { command: "bunx tsc --noEmit", name: "typecheck", requiredForLevel: 1 },
-    { command: "bun test", name: "tests", requiredForLevel: 2 },
+    { command: "bunx tsc --noEmit", name: "typecheck", requiredForLevel: 1, timeoutMs: TYPE_CHECK_TIMEOUT_MS },
+    { command: "bun test", name: "tests", requiredForLevel: 2, timeoutMs: TEST_TIMEOUT_MS },
   ];
   
   const results: ValidationResult["commands"] = [];
   
-  for (const { command, name } of commands) {
+  for (const { command, timeoutMs } of commands) {
+    if (results.some((r) => !r.passed)) {
+      results.push({ command, passed: false, output: "Skipped (earlier command failed)" });
+      continue;
+    }
+
     try {
-      const { exitCode, stdout, stderr } = await execCommand(
+      // Bounded capture with a timeout: only a snippet reaches the PR body
+      const { exitCode, stdout, stderr, timedOut } = await runCommand(
         command.split(" "),
-        worktreePath
+        worktreePath,
+        timeoutMs
       );
       
-      const passed = exitCode === 0;
-      const output = passed 
-        ? `Passed (${stdout.trim() || 'OK'})`
-        : `Failed: ${stderr.trim()}`;
+      const passed = exitCode === 0 && !timedOut;
+      const output = timedOut
+        ? `Failed: timed out after ${timeoutMs / 1000}s`
+        : passed
+          ? `Passed (${outputSnippet(stdout) || 'OK'})`
+          : `Failed: ${outputSnippet(stderr)}`;
       
       results.push({ command, passed, output });
     } catch (error) {
@@ -7,6 +7,33 @@
  */
 import { join } from "node:path";
 
+/**
+ * Processed file contents keyed by path, invalidated by modification time.
+ * Build-fix retries and batch runs load the same prompts repeatedly; this
+ * skips the re-read and re-parse while still picking up edits made by the
+ * improve phase.
+ */
+const processedCache = new Map<string, { mtime: number; content: string }>();
+
+/**
+ * Read a file through the processed cache, applying `transform` on a miss
+ */
+async function readProcessed(
+  file: ReturnType<typeof Bun.file>,
+  filePath: string,
+  transform: (raw: string) => string
+): Promise<string> {
+  const mtime = file.lastModified;
+  const cached = processedCache.get(filePath);
+  if (cached && cached.mtime === mtime) {
+    return cached.content;
+  }
+
+  const content = transform(await file.text());
+  processedCache.set(filePath, { mtime, content });
+  return content;
+}
+
 /**
  * Load an agent prompt file, strip YAML frontmatter, and return the markdown body.
  *
@@ -37,8 +64,7 @@ export async function loadAgentPrompt(
     );
   }
 
-  const raw = await file.text();
-  return stripFrontmatter(raw);
+  return readProcessed(file, filePath, stripFrontmatter);
 }
 
 /**
@@ -93,10 +119,21 @@ export async function loadExpertiseConventions(
     );
   }
 
-  const raw = await file.text();
-  return extractConventionsSummary(raw, domain);
+  return readProcessed(file, filePath, (raw) => extractConventionsSummary(raw, domain));
 }
 
+/** Top-level YAML key (no indentation) */
+const TOP_LEVEL_KEY_PATTERN = /^[a-z_]+:/;
+
+/** Second-level YAML key (2-space indent) */
+const SECOND_LEVEL_KEY_PATTERN = /^  [a-z_]+:/;
+
+/** YAML list item at any indentation */
+const LIST_ITEM_PATTERN = /^\s+-\s+(.+)$/;
+
+/** YAML list item at 4-space indentation (best_practices subsection bullets) */
+const NESTED_LIST_ITEM_PATTERN = /^\s{4}-\s+(.+)$/;
+
 /**
  * Extract a compact conventions summary from raw expertise YAML.
  *
@@ -127,14 +164,14 @@ function extractConventionsSummary(yamlContent: string, domain: string): string
 
   for (const line of lines) {
     // Track top-level keys (no indentation)
-    if (/^[a-z_]+:/.test(line)) {
+    if (TOP_LEVEL_KEY_PATTERN.test(line)) {
       currentTopLevel = line.split(":")[0]!.trim();
       currentSecondLevel = "";
       continue;
     }
 
     // Track second-level keys (2-space indent)
-    if (/^  [a-z_]+:/.test(line)) {
+    if (SECOND_LEVEL_KEY_PATTERN.test(line)) {
       currentSecondLevel = line.trim().split(":")[0]!.trim();
 
       // Capture key operation names
@@ -150,7 +187,7 @@ function extractConventionsSummary(yamlContent: string, domain: string): string
 
     // Capture scope file paths
     if (currentTopLevel === "overview" && currentSecondLevel === "primary_codebase") {
-      const match = line.match(/^\s+-\s+(.+)$/);
+      const match = line.match(LIST_ITEM_PATTERN);
       if (match?.[1]) {
         sections.scope.push(match[1].trim());
       }
@@ -158,7 +195,7 @@ function extractConventionsSummary(yamlContent: string, domain: string): string
 
     // Capture best practice bullet points (top-level items under best_practices subsections)
     if (currentTopLevel === "best_practices") {
-      const match = line.match(/^\s{4}-\s+(.+)$/);
+      const match = line.match(NESTED_LIST_ITEM_PATTERN);
       if (match?.[1]) {
         sections.bestPractices.push(match[1].trim());
       }
@@ -242,9 +242,11 @@ export function summarizeToolOutput(toolName: string, toolInput: unknown): strin
   }
 }
 
+const KEY_ACTION_TOOLS: ReadonlySet<string> = new Set(["Write", "Edit"]);
+
 /**
  * Determine if tool action should always be logged (not just verbose)
  */
 export function isKeyAction(toolName: string): boolean {
-  return ["Write", "Edit"].includes(toolName);
+  return KEY_ACTION_TOOLS.has(toolName);
 }
@@ -26,10 +26,13 @@ export interface ValidateOptions {
 }
 
 /** Timeout for type-check (60 seconds) */
-const TYPE_CHECK_TIMEOUT_MS = 60_000;
+export const TYPE_CHECK_TIMEOUT_MS = 60_000;
 
 /** Timeout for test execution (120 seconds) */
-const TEST_TIMEOUT_MS = 120_000;
+export const TEST_TIMEOUT_MS = 120_000;
+
+/** Upper bound on captured bytes per output stream; error parsing only needs the head */
+export const MAX_OUTPUT_BYTES = 1024 * 1024;
 
 /** Maximum depth for relative imports before suggesting path aliases */
 const MAX_RELATIVE_DEPTH = 3;
@@ -42,10 +45,35 @@ const CONSOLE_PATTERNS = [
   /\bconsole\.info\b/,
 ];
 
+/** Relative import climbing three or more directories */
+const DEEP_RELATIVE_IMPORT_PATTERN =
+  /(?:from\s+['"]|import\s+['"]|require\s*\(\s*['"])(\.\.\/(?:\.\.\/){2,}[^'"]+)['"]/;
+
+const decoder = new TextDecoder();
+
+/**
+ * Drain a subprocess stream, retaining at most MAX_OUTPUT_BYTES
+ * The stream is always read to completion so the child never blocks on a
+ * full pipe, but memory stays bounded however verbose the command is
+ */
+export async function readBounded(stream: ReadableStream<Uint8Array>): Promise<string> {
+  const chunks: Uint8Array[] = [];
+  let retained = 0;
+
+  for await (const chunk of stream) {
+    if (retained >= MAX_OUTPUT_BYTES) continue;
+    const take = Math.min(chunk.length, MAX_OUTPUT_BYTES - retained);
+    chunks.push(take === chunk.length ? chunk : chunk.subarray(0, take));
+    retained += take;
+  }
+
+  return decoder.decode(Buffer.concat(chunks));
+}
+
 /**
  * Run a subprocess with a timeout, returning stdout, stderr, and exit code
  */
-async function runCommand(
+export async function runCommand(
   args: string[],
   cwd: string,
   timeoutMs: number,
@@ -63,8 +91,8 @@ async function runCommand(
   }, timeoutMs);
 
   const [stdout, stderr, exitCode] = await Promise.all([
-    new Response(proc.stdout).text(),
-    new Response(proc.stderr).text(),
+    readBounded(proc.stdout),
+    readBounded(proc.stderr),
     proc.exited,
   ]);
 
@@ -72,6 +100,33 @@ async function runCommand(
   return { stdout: stdout.trim(), stderr: stderr.trim(), exitCode, timedOut };
 }
 
+/**
+ * Collect trimmed lines matching `predicate`, stopping once `limit` are found
+ * Walks the output by index rather than splitting it, so a capped scan of a
+ * large log never materializes every line
+ */
+export function collectMatchingLines(
+  output: string,
+  predicate: (line: string) => boolean,
+  limit = Number.POSITIVE_INFINITY,
+): string[] {
+  const matches: string[] = [];
+  let start = 0;
+
+  while (start <= output.length && matches.length < limit) {
+    const newline = output.indexOf("\n", start);
+    const end = newline === -1 ? output.length : newline;
+    const line = output.slice(start, end);
+    if (predicate(line)) {
+      matches.push(line.trim());
+    }
+    if (newline === -1) break;
+    start = newline + 1;
+  }
+
+  return matches;
+}
+
 /**
  * Run type-check via bunx tsc --noEmit
  */
@@ -94,10 +149,9 @@ async function runTypeCheck(
 
   // Parse tsc error output - errors appear on stdout for tsc
   const output = stdout || stderr;
-  const errorLines = output
-    .split("\n")
-    .filter((line) => line.includes("error TS"))
-    .map((line) => line.trim());
+  const errorLines = collectMatchingLines(output, (line) =>
+    line.includes("error TS"),
+  );
 
   // If we couldn't parse specific errors, include the raw output (truncated)
   if (errorLines.length === 0 && output.length > 0) {
@@ -115,10 +169,16 @@ async function runTypeCheck(
 async function runTests(
   projectRoot: string,
 ): Promise<{ passed: boolean; errors: string[]; skipped: boolean }> {
-  // Check if any test files exist
+  // Check if any test files exist: prune dependency/VCS trees (bun test skips
+  // them too) and stop at the first match instead of listing every file
   const findProc = Bun.spawn(
-    ["find", projectRoot, "-name", "*.test.ts", "-o", "-name", "*.spec.ts"],
-    { cwd: projectRoot, stdout: "pipe", stderr: "pipe" },
+    [
+      "find", projectRoot,
+      "(", "-name", "node_modules", "-o", "-name", ".git", ")", "-prune",
+      "-o", "(", "-name", "*.test.ts", "-o", "-name", "*.spec.ts", ")",
+      "-print", "-quit",
+    ],
+    { cwd: projectRoot, stdout: "pipe", stderr: "ignore" },
   );
   const findOutput = await new Response(findProc.stdout).text();
   await findProc.exited;
@@ -143,17 +203,15 @@ async function runTests(
 
   // Parse test failure output
   const output = stdout || stderr;
-  const failureLines = output
-    .split("\n")
-    .filter(
-      (line) =>
-        line.includes("FAIL") ||
-        line.includes("error:") ||
-        line.includes("Error:") ||
-        line.includes("expected"),
-    )
-    .map((line) => line.trim())
-    .slice(0, 20); // Cap at 20 lines
+  const failureLines = collectMatchingLines(
+    output,
+    (line) =>
+      line.includes("FAIL") ||
+      line.includes("error:") ||
+      line.includes("Error:") ||
+      line.includes("expected"),
+    20, // Cap at 20 lines
+  );
 
   if (failureLines.length === 0 && output.length > 0) {
     const truncated =
@@ -185,28 +243,30 @@ async function scanConventions(
     }
 
     const lines = content.split("\n");
+    const isAppSource = filePath.includes("app/src/");
 
     for (let i = 0; i < lines.length; i++) {
       const line = lines[i]!;
       const lineNum = i + 1;
 
-      // Check for console.* usage
-      for (const pattern of CONSOLE_PATTERNS) {
-        if (pattern.test(line)) {
-          // Skip if it's in a comment
-          const trimmed = line.trim();
-          if (trimmed.startsWith("//") || trimmed.startsWith("*")) continue;
-          violations.push(
-            `${filePath}:${lineNum}: console.* usage (use process.stdout/stderr.write)`,
-          );
+      // Check for console.* usage (substring pre-filter skips the regexes
+      // for the vast majority of lines)
+      if (line.includes("console.")) {
+        for (const pattern of CONSOLE_PATTERNS) {
+          if (pattern.test(line)) {
+            // Skip if it's in a comment
+            const trimmed = line.trim();
+            if (trimmed.startsWith("//") || trimmed.startsWith("*")) continue;
+            violations.push(
+              `${filePath}:${lineNum}: console.* usage (use process.stdout/stderr.write)`,
+            );
+          }
         }
       }
 
       // Check for deep relative imports in app/src/ files
-      if (filePath.includes("app/src/")) {
-        const importMatch = line.match(
-          /(?:from\s+['"]|import\s+['"]|require\s*\(\s*['"])(\.\.\/(?:\.\.\/){2,}[^'"]+)['"]/,
-        );
+      if (isAppSource && line.includes("../../../")) {
+        const importMatch = line.match(DEEP_RELATIVE_IMPORT_PATTERN);
         if (importMatch) {
           violations.push(
             `${filePath}:${lineNum}: deep relative import "${importMatch[1]}" (use path aliases)`,
@@ -262,18 +322,19 @@ export async function validateBuildOutput(
 ): Promise<ValidationResult> {
   const { projectRoot, filesModified, skipTests, skipTypeCheck } = options;
 
-  // Run type-check
+  // The convention scan is cheap file I/O, so it overlaps the heavy checks.
+  // Type-check and tests stay serial: run together (times batch concurrency)
+  // they contend for CPU under fixed timeouts, and a timeout surfaces as a
+  // validation error that triggers a full build-fix retry
+  const pendingConventions = scanConventions(filesModified);
+
   const typeCheck = skipTypeCheck
     ? { passed: true, errors: [] as string[] }
     : await runTypeCheck(projectRoot);
-
-  // Run tests
   const tests = skipTests
     ? { passed: true, errors: [] as string[], skipped: true }
     : await runTests(projectRoot);
-
-  // Run convention scan
-  const conventions = await scanConventions(filesModified);
+  const conventions = await pendingConventions;
 
   // Type-check and tests must pass; conventions are advisory
   const passed = typeCheck.passed && tests.passed;
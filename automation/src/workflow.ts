@@ -4,7 +4,11 @@
 import { dirname } from "node:path";
 import { WorkflowLogger } from "./logger.ts";
 import { ConsoleReporter } from "./reporter.ts";
-import { orchestrateWorkflow, type OrchestrationOptions } from "./orchestrator.ts";
+import {
+  orchestrateWorkflow,
+  type GitHubIssue,
+  type OrchestrationOptions
+} from "./orchestrator.ts";
 import { generateWorkflowId } from "./context.ts";
 
 export interface WorkflowResult {
@@ -38,12 +42,12 @@ export interface WorkflowOptions {
     filesModified: string[];
     completedPhases: string[];
   };
+  /** Issue fetch started by the caller, reused instead of fetching again */
+  prefetchedIssue?: Promise<GitHubIssue>;
 }
 
-function getProjectRoot(): string {
-  // automation/src/workflow.ts -> automation -> project root
-  return dirname(dirname(import.meta.dir));
-}
+// automation/src/workflow.ts -> automation -> project root (resolved once at import)
+const DEFAULT_PROJECT_ROOT = dirname(dirname(import.meta.dir));
 
 export async function runWorkflow(opts: WorkflowOptions): Promise<WorkflowResult> {
   const {
@@ -55,14 +59,14 @@ export async function runWorkflow(opts: WorkflowOptions): Promise<WorkflowResult
     mainProjectRoot,
     branchName,
     resumeFromPhase,
-    checkpointData
+    checkpointData,
+    prefetchedIssue
   } = opts;
 
-  const defaultProjectRoot = getProjectRoot();
   // Use workingDirectory for SDK execution (may be worktree)
-  const executionRoot = workingDirectory ?? defaultProjectRoot;
+  const executionRoot = workingDirectory ?? DEFAULT_PROJECT_ROOT;
   // Use mainProjectRoot for logging (always main repo, not worktree)
-  const logRoot = mainProjectRoot ?? defaultProjectRoot;
+  const logRoot = mainProjectRoot ?? DEFAULT_PROJECT_ROOT;
 
   const logger = new WorkflowLogger({ 
     issueNumber, 
@@ -129,7 +133,8 @@ export async function runWorkflow(opts: WorkflowOptions): Promise<WorkflowResult
       verbose,
       workflowId,
       resumeFromPhase,
-      checkpointData
+      checkpointData,
+      prefetchedIssue
     };
 
     // Use orchestrator with reporter integration
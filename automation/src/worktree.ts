@@ -4,7 +4,7 @@
  * Enables parallel execution and change isolation by creating dedicated
  * working directories for each workflow execution.
  */
-import { existsSync, mkdirSync } from "node:fs";
+import { mkdirSync } from "node:fs";
 import { join } from "node:path";
 
 export interface WorktreeConfig {
@@ -51,9 +51,7 @@ export async function createWorktree(
   
   // Ensure .worktrees directory exists
   const worktreesDir = join(projectRoot, "automation", ".worktrees");
-  if (!existsSync(worktreesDir)) {
-    mkdirSync(worktreesDir, { recursive: true });
-  }
+  mkdirSync(worktreesDir, { recursive: true });
   
   // Create worktree
   const proc = Bun.spawn(
@@ -99,15 +97,18 @@ export async function removeWorktree(
 ): Promise<void> {
   const { force = false, removeBranch = false } = options;
   
+  // Single listing serves both the existence check and branch lookup
+  const listing = await listWorktreesPorcelain();
+  
   // Check if worktree exists
-  if (!await worktreeExists(worktreePath)) {
+  if (!listing.includes(worktreePath)) {
     return; // Already removed, no-op
   }
   
   // Get worktree info before removal
   let branchName: string | null = null;
   if (removeBranch) {
-    const info = await getWorktreeInfo(worktreePath);
+    const info = parseWorktreeInfo(listing, worktreePath);
     branchName = info?.branch ?? null;
   }
   
@@ -152,20 +153,27 @@ export async function removeWorktree(
 }
 
 /**
- * Check if worktree exists at path
+ * Run `git worktree list --porcelain` and return its raw output
  */
-export async function worktreeExists(
-  worktreePath: string
-): Promise<boolean> {
+async function listWorktreesPorcelain(): Promise<string> {
   const proc = Bun.spawn(
     ["git", "worktree", "list", "--porcelain"],
     {
       stdout: "pipe",
-      stderr: "pipe"
+      stderr: "ignore" // Only stdout is parsed
     }
   );
   
-  const output = await new Response(proc.stdout).text();
+  return new Response(proc.stdout).text();
+}
+
+/**
+ * Check if worktree exists at path
+ */
+export async function worktreeExists(
+  worktreePath: string
+): Promise<boolean> {
+  const output = await listWorktreesPorcelain();
   return output.includes(worktreePath);
 }
 
@@ -176,15 +184,16 @@ export async function worktreeExists(
 export async function getWorktreeInfo(
   worktreePath: string
 ): Promise<{ branch: string; commit: string } | null> {
-  const proc = Bun.spawn(
-    ["git", "worktree", "list", "--porcelain"],
-    {
-      stdout: "pipe",
-      stderr: "pipe"
-    }
-  );
-  
-  const output = await new Response(proc.stdout).text();
+  return parseWorktreeInfo(await listWorktreesPorcelain(), worktreePath);
+}
+
+/**
+ * Extract branch and commit for a worktree from porcelain listing output
+ */
+export function parseWorktreeInfo(
+  output: string,
+  worktreePath: string
+): { branch: string; commit: string } | null {
   const lines = output.split("\n");
   
   let inWorktree = false;